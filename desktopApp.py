@@ -1,6 +1,8 @@
-import sys, os
-from datetime import datetime
-from collections import defaultdict
+import sys, os, re, mmap
+from datetime import datetime, time, timedelta
+from collections import defaultdict, Counter
+
+import numpy as np
 
 from PyQt5.QtWidgets import (
     QApplication,
@@ -11,72 +13,207 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QLabel,
     QTabWidget,
+    QTabBar,
+    QStackedWidget,
     QComboBox,
+    QCheckBox,
     QTextEdit,
     QDateEdit,
     QListWidget,
     QListWidgetItem,
     QFrame,
-    QTableWidget, 
-    QTableWidgetItem,QHeaderView
+    QTableView,
+    QAbstractItemView,
+    QHeaderView
+)
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImageReader, QPalette, QColor, QPainter, QPen
+from PyQt5.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QRectF,
+    QSize,
+    QFile,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
 )
-from PyQt5.QtGui import QPixmap, QPalette, QColor
-from PyQt5.QtCore import Qt
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.dates as mdates
-import mplcursors
-
-_chart_css = """
-                               QFrame {
-                               background-color: #ffffff;
-                               border: 1px solid #555;
-                               border-radius: 20px;
-                               padding: 8px;
-                               }
-                               """
-
-_gauge_css = """
-                               QFrame {
-                               background-color: #ffffff;
-                               border: 1px solid #555;
-                               border-radius: 20px;
-                               padding: 8px;
-                               }
-                               """
-
-
-# ---------------- Dashboard Gauge Helper ----------------
-def create_gauge(value, maximum, title, color="green"):
-    fig, ax = plt.subplots(figsize=(3, 3), subplot_kw={"projection": "polar"})
-    # Simple polar bar to mimic a gauge fill
-    ax.bar(0, value, width=3.14, bottom=0, color=color, alpha=0.7)
-    ax.set_ylim(0, max(maximum, 1))
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_title(f"{title}\n{value}/{maximum}", fontsize=12)
-    fig.tight_layout()
-    return fig
+
+from dateutil import tz as dateutil_tz
+
+# ---------------- Plotting imports ----------------
+# matplotlib/mplcursors are the slowest imports of the app; they are bound here by
+# _import_plotting(), which the window runs on startup or, when deferred, right after
+# its first paint (see AssureVisionApp.finish_loading)
+matplotlib = Figure = FigureCanvas = mdates = mplcursors = None
+
+# timestamps are carried as int epoch seconds; axes are labelled in local time
+_LOCAL_TZ = dateutil_tz.tzlocal()
+_EPOCH_NUM = None
+
+
+def _import_plotting():
+    """Import the matplotlib stack once and apply the module-wide rcParams."""
+    global matplotlib, Figure, FigureCanvas, mdates, mplcursors, _EPOCH_NUM
+    if mplcursors is not None:
+        return
+    import matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    import matplotlib.dates as mdates
+    import mplcursors
+
+    # let Agg drop near-duplicate vertices on dense time series
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    _EPOCH_NUM = mdates.date2num(np.datetime64(0, "s"))
+
+
+def _epoch_to_num(epoch):
+    """Vectorized epoch seconds -> matplotlib date numbers (days)."""
+    return np.asarray(epoch) / 86400.0 + _EPOCH_NUM
+
+# ---------------- Stylesheets ----------------
+# Compiled resources (pyrcc5 styles/styles.qrc -o styles_rc.py) register ":/app.qss" etc.;
+# without them the plain files next to this script are read instead.
+try:
+    import styles_rc  # noqa: F401
+    _HAVE_STYLE_RC = True
+except ImportError:
+    _HAVE_STYLE_RC = False
+
+_STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+
+def _load_qss(name):
+    """Read a stylesheet once, from the Qt resource if compiled, else from styles/."""
+    if _HAVE_STYLE_RC:
+        f = QFile(f":/{name}")
+        if f.open(QFile.ReadOnly):
+            try:
+                return bytes(f.readAll()).decode("utf-8")
+            finally:
+                f.close()
+    # map the file and decode straight from the mapping (no intermediate read buffer)
+    with open(os.path.join(_STYLES_DIR, name), "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ""  # mmap cannot map an empty file
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+# (role, colour) pairs of the dark theme; each distinct QColor is built once and shared
+_WHITE = QColor(Qt.white)
+_GREY = QColor(53, 53, 53)
+_DARK = QColor(25, 25, 25)
+_DARK_PALETTE_ROLES = (
+    (QPalette.Window, _GREY),
+    (QPalette.WindowText, _WHITE),
+    (QPalette.Base, _DARK),
+    (QPalette.AlternateBase, _GREY),
+    (QPalette.ToolTipBase, _WHITE),
+    (QPalette.ToolTipText, _WHITE),
+    (QPalette.Text, _WHITE),
+    (QPalette.Button, _GREY),
+    (QPalette.ButtonText, _WHITE),
+    (QPalette.BrightText, QColor(Qt.red)),
+)
+
+# built on first use: QPalette() needs a QApplication to exist
+_DARK_PALETTE = None
+
+
+def _build_dark_palette():
+    """Return the shared dark Fusion palette, constructing it on the first call only."""
+    global _DARK_PALETTE
+    if _DARK_PALETTE is None:
+        palette = QPalette()
+        for role, color in _DARK_PALETTE_ROLES:
+            palette.setColor(role, color)
+        _DARK_PALETTE = palette
+    return _DARK_PALETTE
+
+
+# ---------------- Dashboard Gauge Widget ----------------
+class GaugeWidget(QWidget):
+    """Ring gauge painted with QPainter; filled arc shows value / maximum."""
+
+    def __init__(self, title, color="green", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.color = QColor(color)
+        self.color.setAlphaF(0.7)
+        self.value = 0
+        self.maximum = 1
+        self.setMinimumSize(160, 160)
+
+    def set_value(self, value, maximum):
+        self.value = value
+        self.maximum = maximum
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        ring = 14
+        side = min(self.width(), self.height()) - ring - 4
+        rect = QRectF(
+            (self.width() - side) / 2, (self.height() - side) / 2, side, side
+        )
+
+        # background ring
+        pen = QPen(QColor("#dddddd"), ring)
+        pen.setCapStyle(Qt.FlatCap)
+        painter.setPen(pen)
+        painter.drawArc(rect, 0, 360 * 16)
+
+        # filled arc, clockwise from 12 o'clock
+        if self.value:
+            pen.setColor(self.color)
+            painter.setPen(pen)
+            span = -int(360 * 16 * self.value / max(self.maximum, 1))
+            painter.drawArc(rect, 90 * 16, span)
+
+        painter.setPen(Qt.black)
+        font = painter.font()
+        font.setPointSize(12)
+        painter.setFont(font)
+        painter.drawText(rect, Qt.AlignCenter, f"{self.title}\n{self.value}/{self.maximum}")
 
 
 # ---------------- Helpers ----------------
-def txt_is_pass(text: str) -> bool:
+# label = one comma-separated token, surrounding whitespace trimmed
+_LABEL_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+# group 1 set: Job.Pass / Job.Fail flag; otherwise an explicit ':OK' / '=OK' marker
+_CLASSIFY_RE = re.compile(r"^(JOB\.PASS|JOB\.FAIL)|[:=]OK$", re.I)
+
+
+def classify_labels(text: str):
     """
-    Determine pass/fail from TXT content.
-    Treat as PASS if 'Job.Pass:1' present.
-    Treat as FAIL if 'Job.Fail:1' present or Job.Pass != 1.
+    Parse TXT content once into (is_pass, fail_causes, read_string).
+    Treat as PASS if 'Job.Pass:1' present, otherwise FAIL.
+    fail_causes: interned labels that are not Job.Pass / Job.Fail and not ':OK' (failed items only).
+    read_string: everything except Job.Pass / Job.Fail.
     """
-    labels = [p.strip() for p in text.split(",") if p.strip()]
-    has_pass = any(lbl.replace(" ", "").upper() == "JOB.PASS:1" for lbl in labels)
-    if has_pass:
-        return True
-    # explicit fail flag counts as fail
-    has_fail = any(lbl.replace(" ", "").upper() == "JOB.FAIL:1" for lbl in labels)
-    if has_fail:
-        return False
-    # Default to fail when there is no pass flag
-    return False
+    is_pass = False
+    causes = []
+    read_values = []
+    for lbl in _LABEL_RE.findall(text):
+        norm = lbl.replace(" ", "")
+        m = _CLASSIFY_RE.search(norm)
+        if m and m.group(1):
+            if norm.upper() == "JOB.PASS:1":
+                is_pass = True
+            continue
+        read_values.append(lbl)
+        if m:  # OK marker
+            continue
+        causes.append(sys.intern(lbl))
+    fail_causes = () if is_pass else tuple(causes)
+    return is_pass, fail_causes, ", ".join(read_values)
 
 
 def load_txt(path: str) -> str:
@@ -86,13 +223,303 @@ def load_txt(path: str) -> str:
     except Exception:
         return ""
 
+
+_VERDICT_CHUNK = 4096
+# a whole 'Job.Pass:1' label; must be followed by ',' or the end of the file
+_PASS_FLAG_RE = re.compile(rb"(?:^|,)\s*job *\. *pass *: *1\s*(?=,|\Z)", re.I)
+
+
+def load_txt_for_verdict(path: str):
+    """
+    Read a TXT in small chunks and stop as soon as a 'Job.Pass:1' label is seen.
+    Returns (True, None) when the PASS flag settled it early, otherwise
+    (None, content) with the full stripped text for classify_labels.
+    """
+    buf = b""
+    try:
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(_VERDICT_CHUNK)
+                eof = not chunk
+                buf += chunk
+                m = _PASS_FLAG_RE.search(buf)
+                # a match at the very end may still continue in the next chunk
+                if m and (eof or m.end() < len(buf)):
+                    return True, None
+                if eof:
+                    break
+    except Exception:
+        return None, ""
+    return None, buf.decode("utf-8", errors="ignore").strip()
+
+
+def _iter_txt(folder):
+    """
+    Recursively yield (path, mtime) for every .txt file under folder.
+    Uses os.scandir so the mtime comes from the cached DirEntry stat.
+    """
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_txt(entry.path)
+                elif entry.name.lower().endswith(".txt"):
+                    yield entry.path, entry.stat().st_mtime
+            except OSError:
+                continue
+
+def _clear_tabs(tabs):
+    """
+    Remove every page of a QTabWidget and schedule it for deletion.
+    QTabWidget.clear() only detaches pages, so old viewers would stay alive.
+    """
+    blocked = tabs.blockSignals(True)
+    while tabs.count():
+        page = tabs.widget(0)
+        tabs.removeTab(0)
+        page.deleteLater()
+    tabs.blockSignals(blocked)
+
+
+_CARD_BACKGROUND = QColor("#ffffff")
+_CARD_MARGIN = 8
+# charts may shrink with the window, but not below this
+_CHART_MIN_SIZE = QSize(320, 200)
+
+
+class CardFrame(QFrame):
+    """QFrame with a size hint fixed at construction, so layouts never re-measure its content."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._size_hint = QSize()
+
+    def sizeHint(self):
+        return self._size_hint if self._size_hint.isValid() else super().sizeHint()
+
+
+def _make_card(content):
+    """
+    Wrap a chart canvas or gauge in a white panel card.
+    Drawn from the palette by the native style, so no stylesheet rules are involved.
+    """
+    card = CardFrame()
+    card.setObjectName("chartCard")
+    card.setUpdatesEnabled(False)
+    card.setFrameShape(QFrame.StyledPanel)
+    card.setAutoFillBackground(True)
+    palette = card.palette()
+    palette.setColor(QPalette.Window, _CARD_BACKGROUND)
+    card.setPalette(palette)
+    card_layout = QVBoxLayout(card)
+    card_layout.setContentsMargins(_CARD_MARGIN, _CARD_MARGIN, _CARD_MARGIN, _CARD_MARGIN)
+    card_layout.setSpacing(0)
+    card_layout.addWidget(content)
+    # content hint + layout margins + frame, measured once
+    border = 2 * (_CARD_MARGIN + card.frameWidth())
+    card._size_hint = content.sizeHint().expandedTo(content.minimumSize()) + QSize(border, border)
+    card.setMinimumSize(content.minimumSize() + QSize(border, border))
+    card.setUpdatesEnabled(True)
+    return card
+
+
+def _object_array(items):
+    # element-wise fill so tuples/strings are never broadcast into extra dimensions
+    arr = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        arr[i] = item
+    return arr
+
+# ---------------- Data parsing (runs on a worker thread) ----------------
+def parse_folder_data(folder):
+    """
+    Parse every TXT under folder; touches no Qt objects.
+    Returns a dict with:
+      data:           { prefix: { "ts", "is_pass", "paths", "eid" arrays } }
+      events_by_path: { txt path: { "ts", "is_pass", "read_string" (None = not read yet) } }
+      event_paths:    object[:] txt path per event id
+      cause_eids / cause_labels: reverse index, one (event id, cause) pair per failure cause
+    """
+    columns = defaultdict(lambda: {"ts": [], "is_pass": [], "paths": [], "eid": []})
+    events_by_path = {}
+    event_paths = []
+    cause_eids = []
+    cause_labels = []
+
+    for file_path, mtime in _iter_txt(folder):
+        file = os.path.basename(file_path)
+        ts = int(mtime)
+        parts = file[:-4].split("_")
+        prefix = "_".join(parts[:-1]) if len(parts) > 1 else parts[0]
+
+        is_pass, content = load_txt_for_verdict(file_path)
+        if is_pass:
+            # PASS found while streaming: no causes to aggregate, read string loaded on display
+            fail_causes, read_string = (), None
+        else:
+            is_pass, fail_causes, read_string = classify_labels(content)
+
+        eid = len(event_paths)
+        event_paths.append(file_path)
+        # failure causes are only collected for failed items
+        for lbl in fail_causes:
+            cause_eids.append(eid)
+            cause_labels.append(lbl)
+
+        cols = columns[prefix]
+        cols["ts"].append(ts)
+        cols["is_pass"].append(is_pass)
+        cols["paths"].append(file_path)
+        cols["eid"].append(eid)
+        events_by_path[file_path] = {
+            "ts": ts,
+            "is_pass": is_pass,
+            "read_string": read_string,
+        }
+
+    data_by_prefix = {}
+    for prefix, cols in columns.items():
+        ts = np.asarray(cols["ts"], dtype=np.int64)
+        order = np.argsort(ts, kind="stable")
+        data_by_prefix[prefix] = {
+            "ts": ts[order],
+            "is_pass": np.asarray(cols["is_pass"], dtype=bool)[order],
+            "paths": _object_array(cols["paths"])[order],
+            "eid": np.asarray(cols["eid"], dtype=np.int64)[order],
+        }
+    return {
+        "data": data_by_prefix,
+        "events_by_path": events_by_path,
+        "event_paths": _object_array(event_paths),
+        "cause_eids": np.asarray(cause_eids, dtype=np.int64),
+        "cause_labels": _object_array(cause_labels),
+    }
+
+
+class ParseSignals(QObject):
+    finished = pyqtSignal(str, object)  # folder, parse_folder_data result
+
+
+class ParseJob(QRunnable):
+    """Runs parse_folder_data on the QThreadPool and emits the result back to the UI thread."""
+
+    def __init__(self, folder):
+        super().__init__()
+        self.folder = folder
+        self.signals = ParseSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.folder, parse_folder_data(self.folder))
+
+
+# ---------------- Chart series (runs on a worker thread) ----------------
+def prepare_chart_series(filtered_data, time_bin=60):
+    """
+    Numeric prep shared by the time charts, computed once per filter change:
+    { prefix: (x date nums, cumulative counts, (bin times, pass per bin, fail per bin)) }
+    Prefixes without events are left out. Only numpy work here, no matplotlib objects.
+    """
+    series = {}
+    for prefix, cols in filtered_data.items():
+        ts_epoch = cols["ts"]
+        if not len(ts_epoch):
+            continue
+        x_vals = _epoch_to_num(ts_epoch)  # already sorted at ingest
+        counts = np.arange(1, len(ts_epoch) + 1)  # 1 per event after filters
+        is_pass = cols["is_pass"]
+        uniq, inv = np.unique(ts_epoch // time_bin, return_inverse=True)
+        pass_vals = np.bincount(inv[is_pass], minlength=len(uniq))
+        fail_vals = np.bincount(inv[~is_pass], minlength=len(uniq))
+        series[prefix] = (x_vals, counts, (_epoch_to_num(uniq * time_bin), pass_vals, fail_vals))
+    return series
+
+
+class ChartPrepSignals(QObject):
+    finished = pyqtSignal(int, object)  # generation, prepare_chart_series result
+
+
+class ChartPrepJob(QRunnable):
+    """Runs prepare_chart_series on the QThreadPool; figures are still drawn on the UI thread."""
+
+    def __init__(self, generation, filtered_data):
+        super().__init__()
+        self.generation = generation
+        self.filtered_data = filtered_data
+        self.signals = ChartPrepSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.generation, prepare_chart_series(self.filtered_data))
+
+# ---------------- Table model for FolderViewer ----------------
+
+class RowsModel(QAbstractTableModel):
+    """Read-only model exposing one page of FolderViewer rows."""
+
+    HEADERS = ["Timestamp", "File", "Result", "Read String"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._page_offset = 0
+        self._page_size = 0
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._page_offset = 0
+        self._page_size = 0
+        self.endResetModel()
+
+    def set_page(self, start, end):
+        # row count changes between pages, so this is a reset rather than layoutChanged
+        self.beginResetModel()
+        self._page_offset = start
+        self._page_size = max(0, min(end, len(self._rows)) - start)
+        self.endResetModel()
+
+    def row_at(self, row):
+        return self._rows[self._page_offset + row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._page_size
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = self.row_at(index.row())
+        value = row[index.column()]
+        if index.column() == 0:
+            return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+        if value is None and index.column() == 3:
+            # read string skipped at ingest (PASS items): load it once, keep it in the row
+            value = classify_labels(load_txt(row[5]))[2]
+            self._rows[self._page_offset + index.row()] = row[:3] + (value,) + row[4:]
+        return value
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
 # ---------------- FolderViewer with clickable list ----------------
 
 class FolderViewer(QWidget):
-    def __init__(self, folder, outcome_filter='All', parent=None):
+    def __init__(self, folder, outcome_filter='All', events=None, cache=None, parent=None):
         super().__init__(parent)
         self.current_folder = folder
         self.outcome_filter = outcome_filter
+        # parsed events keyed by txt path (from parse_folder_data)
+        self.events = events or {}
+        # optional shared memo { (folder, outcome_filter): (folder mtime_ns, rows) }
+        self.cache = cache
         self.all_rows = []
         self.page_size = 10
         self.current_page = 0
@@ -105,16 +532,14 @@ class FolderViewer(QWidget):
         layout.addWidget(self.image_label, 3)
 
         # --- Table for metadata ---
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(
-            ["Timestamp", "File", "Result", "Read String"]
-        )
+        self.table = QTableView()
+        self.model = RowsModel(self)
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)  # non-editable
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)  # select entire row
-        self.table.setSelectionMode(QTableWidget.SingleSelection)  # one row at a time
-        self.table.cellClicked.connect(self.row_clicked)  # connect click event
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # non-editable
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)  # select entire row
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)  # one row at a time
+        self.table.clicked.connect(self.row_clicked)  # connect click event
         layout.addWidget(self.table, 2)
 
         # --- Pagination controls ---
@@ -147,19 +572,40 @@ class FolderViewer(QWidget):
         self.populate_table()
 
     def populate_table(self):
-        self.all_rows = []
-        bmp_files = [f for f in os.listdir(self.current_folder) if f.lower().endswith('.bmp')]
-        bmp_files.sort()
-
-        for f in bmp_files:
-            base = f[:-4]
-            img_path = os.path.join(self.current_folder, f)
-            txt_path = os.path.join(self.current_folder, base + '.txt')
-            if not os.path.exists(txt_path):
-                continue
+        key = (self.current_folder, self.outcome_filter)
+        mtime_ns = os.stat(self.current_folder).st_mtime_ns
+        hit = self.cache.get(key) if self.cache is not None else None
+        if hit is not None and hit[0] == mtime_ns:
+            self.all_rows = hit[1]
+        else:
+            self.all_rows = self._build_rows()
+            if self.cache is not None:
+                self.cache[key] = (mtime_ns, self.all_rows)
+
+        self.model.set_rows(self.all_rows)
+        self.current_page = 0
+        self.refresh_page()
 
-            content = load_txt(txt_path)
-            is_pass = txt_is_pass(content)
+    def _build_rows(self):
+        rows = []
+        # one scandir pass: pair .bmp with .txt by basename
+        bmp_files = {}
+        txt_files = {}
+        with os.scandir(self.current_folder) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith('.bmp'):
+                    bmp_files[entry.name[:-4]] = entry.path
+                elif name.endswith('.txt'):
+                    txt_files[entry.name[:-4]] = entry.path
+
+        for base in sorted(bmp_files):
+            img_path = bmp_files[base]
+            txt_path = txt_files.get(base)
+            ev = self.events.get(txt_path)
+            if ev is None:
+                continue
+            is_pass = ev["is_pass"]
 
             # --- Apply outcome filter ---
             if self.outcome_filter == 'Pass' and not is_pass:
@@ -168,7 +614,7 @@ class FolderViewer(QWidget):
                 continue
 
             # timestamp
-            ts = datetime.fromtimestamp(os.path.getmtime(txt_path)).strftime("%Y-%m-%d %H:%M:%S")
+            ts = ev["ts"]  # epoch seconds, formatted by RowsModel on display
 
             # shorten file name
             short_name = base if len(base) < 20 else base[:17] + "..."
@@ -176,47 +622,38 @@ class FolderViewer(QWidget):
             # result column
             result = "✔" if is_pass else "✘"
 
-            # read string = everything except Job.Pass / Job.Fail
-            parts = [p.strip() for p in content.split(",") if p.strip()]
-            read_values = [p for p in parts if not p.upper().startswith("JOB.PASS") and not p.upper().startswith("JOB.FAIL")]
-            read_string = ", ".join(read_values)
-
-            self.all_rows.append((ts, short_name, result, read_string, img_path))
-
-        self.current_page = 0
-        self.refresh_page()
+            rows.append((ts, short_name, result, ev["read_string"], img_path, txt_path))
+        return rows
 
     def refresh_page(self):
         start = self.current_page * self.page_size
         end = start + self.page_size
-        rows = self.all_rows[start:end]
-
-        self.table.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            ts, short_name, result, read_string, img_path = row
-            self.table.setItem(r, 0, QTableWidgetItem(ts))
-            self.table.setItem(r, 1, QTableWidgetItem(short_name))
-            self.table.setItem(r, 2, QTableWidgetItem(result))
-            self.table.setItem(r, 3, QTableWidgetItem(read_string))
+        self.model.set_page(start, end)
 
         # --- Show first image of current page ---
-        if rows:
+        if self.model.rowCount():
             self.table.selectRow(0)  # highlight first row
-            self.show_image(rows[0][4])
+            self.show_image(self.model.row_at(0)[4])
         else:
             self.image_label.clear()
 
     def show_image(self, img_path):
-        pixmap = QPixmap(img_path).scaled(
-            500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        # decoded + scaled pixmaps are cached so revisiting rows/pages skips disk I/O
+        key = f"{img_path}@500x500"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            # let the decoder downscale while reading instead of scaling the full image
+            reader = QImageReader(img_path)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(500, 500, Qt.KeepAspectRatio))
+            pixmap = QPixmap.fromImage(reader.read())
+            QPixmapCache.insert(key, pixmap)
         self.image_label.setPixmap(pixmap)
 
-    def row_clicked(self, row, col):
-        start = self.current_page * self.page_size
-        actual_index = start + row
-        if 0 <= actual_index < len(self.all_rows):
-            img_path = self.all_rows[actual_index][4]
+    def row_clicked(self, index):
+        if 0 <= index.row() < self.model.rowCount():
+            img_path = self.model.row_at(index.row())[4]
             self.show_image(img_path)
 
     def change_page_size(self, text):
@@ -245,18 +682,23 @@ class FolderViewer(QWidget):
 
 # ---------------- Main Application ----------------
 class AssureVisionApp(QWidget):
-    def __init__(self):
+    def __init__(self, defer_imports=False):
         super().__init__()
         self.setWindowTitle("AssureVision - Python Desktop (PyQt5)")
         self.resize(1400, 900)
+        # no repaints while the widget tree is assembled; re-enabled at the end
+        self.setUpdatesEnabled(False)
 
         self.folder_path = None
         self.chart_type = "Line"
         self.outcome_filter = "All"  # All | Fail | Pass
 
-        # Data structure: { prefix: [ { "ts": datetime, "is_pass": bool, "path": str, "content": str } , ... ] }
+        # Data structure (parallel arrays per prefix, sorted by ts):
+        # { prefix: { "ts": int64[:] epoch s, "is_pass": bool[:], "paths": object[:], "eid": int64[:] } }
         self.all_data = {}
         self.filtered_data = {}
+        # per-file records { txt path: { "ts": int epoch s, "is_pass": bool, "read_string": str | None } } for FolderViewer
+        self._events_by_path = {}
 
         self.layout = QVBoxLayout(self)
 
@@ -293,6 +735,11 @@ class AssureVisionApp(QWidget):
         self.end_date_edit.dateChanged.connect(self.update_everything)
         top_layout.addWidget(self.end_date_edit)
 
+        # Dashboard tooltips are opt-in; the dashboard is rarely hovered
+        self.dashboard_tooltips_check = QCheckBox("Dashboard Tooltips")
+        self.dashboard_tooltips_check.toggled.connect(self.update_dashboard)
+        top_layout.addWidget(self.dashboard_tooltips_check)
+
         self.layout.addLayout(top_layout)
 
         # Main tabs
@@ -301,7 +748,7 @@ class AssureVisionApp(QWidget):
 
         self.dashboard_tab = QWidget()
         self.images_tab = QTabWidget()  # sub-tabs per subfolder
-        self.charts_tab = QTabWidget()  # sub-tabs for charts
+        self.charts_tab = QWidget()  # chart tab bar over a stack of chart pages
         self.system_tab = QWidget()
 
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
@@ -314,14 +761,86 @@ class AssureVisionApp(QWidget):
         self.system_tab.setLayout(QVBoxLayout())
         self.system_tab.layout().addWidget(QLabel("System health goes here"))
 
-        # Dashboard placeholders for gauges + cumulative step chart
+        # Chart pages are built once; their figures are re-plotted in place.
+        # A bare tab bar switches a stacked widget, so page swaps are just setCurrentIndex
+        self.chart_tab_bar = QTabBar()
+        self.chart_stack = QStackedWidget()
+        charts_layout = QVBoxLayout(self.charts_tab)
+        charts_layout.addWidget(self.chart_tab_bar)
+        charts_layout.addWidget(self.chart_stack)
+        self._chart_tabs = {}
+        self._chart_renderers = {
+            "Cumulative": self.render_cumulative_chart,
+            "Heartbeat": self.render_heartbeat_chart,
+            "Summary": self.render_summary_chart,
+            "Failure Causes": self.render_failure_causes_chart,
+        }
+        for name in self._chart_renderers:
+            tab = QWidget()
+            tab.setLayout(QVBoxLayout())
+            self.chart_stack.addWidget(tab)
+            self.chart_tab_bar.addTab(name)
+            self._chart_tabs[name] = tab
+        # { chart name: (fig, ax, canvas) } created on first render, reused afterwards
+        self._chart_canvases = {}
+        self._chart_cursors = {}
+        # charts rendered for the current data; only the visible one is drawn
+        self._built_charts = set()
+        self.chart_tab_bar.currentChanged.connect(self.chart_stack.setCurrentIndex)
+        self.chart_tab_bar.currentChanged.connect(self._materialize_chart_tab)
+        self.tabs.currentChanged.connect(
+            lambda _: self._materialize_chart_tab(self.chart_tab_bar.currentIndex())
+        )
+
+        # Image sub-tabs start as stubs and get a FolderViewer on first view
+        # { stub widget: (sub_path, outcome_filter) }
+        self._lazy_tabs = {}
+        self.images_tab.currentChanged.connect(self._materialize_image_tab)
+        self.tabs.currentChanged.connect(
+            lambda _: self._materialize_image_tab(self.images_tab.currentIndex())
+        )
+
+        # Dashboard gauges (updated in place) + cumulative step chart
         self.gauge_layout = QHBoxLayout()
         self.dashboard_tab.layout().addLayout(self.gauge_layout)
+        self._gauges = {}
+        for title, color in (("Total", "blue"), ("Pass", "green"), ("Fail", "red")):
+            gauge = GaugeWidget(title, color=color)
+            self.gauge_layout.addWidget(_make_card(gauge))
+            self._gauges[title] = gauge
         self.dashboard_step_chart = QVBoxLayout()
         self.dashboard_tab.layout().addLayout(self.dashboard_step_chart)
 
-        # store aggregated failure causes across parsed data (paths list per cause)
-        self._aggregated_failure_causes = defaultdict(list)
+        # failure causes as a reverse index over global event ids:
+        # (_cause_eids[i], _cause_labels[i]) pairs + txt path per event id
+        self._event_paths = np.empty(0, dtype=object)
+        self._cause_eids = np.empty(0, dtype=np.int64)
+        self._cause_labels = np.empty(0, dtype=object)
+        # events (by id) that survive the current filters, set by apply_filters
+        self._keep_mask = np.zeros(0, dtype=bool)
+        self._parse_job = None
+        # prepare_chart_series result for filtered_data (None while a ChartPrepJob runs);
+        # the generation counter drops results of superseded jobs
+        self._chart_series = None
+        self._chart_prep_generation = 0
+        self._chart_prep_job = None
+        # FolderViewer rows memo, reset whenever a new parse lands
+        self._folder_cache = {}
+
+        if defer_imports:
+            # nothing can plot until finish_loading() has imported matplotlib
+            self.select_folder_btn.setEnabled(False)
+            self.dashboard_tooltips_check.setEnabled(False)
+        else:
+            _import_plotting()
+
+        self.setUpdatesEnabled(True)
+
+    def finish_loading(self):
+        """Second startup phase for defer_imports=True: import plotting, then enable the UI."""
+        _import_plotting()
+        self.select_folder_btn.setEnabled(True)
+        self.dashboard_tooltips_check.setEnabled(True)
 
     # ---------------- UI events ----------------
     def select_folder(self):
@@ -329,8 +848,11 @@ class AssureVisionApp(QWidget):
         if not folder:
             return
         self.folder_path = folder
-        self.all_data = self.parse_folder_data(folder)
-        self.update_everything()
+        # parse off the UI thread; _on_parsed picks the result up
+        job = ParseJob(folder)
+        job.signals.finished.connect(self._on_parsed)
+        self._parse_job = job
+        QThreadPool.globalInstance().start(job)
 
     def change_chart_type(self, text):
         self.chart_type = text
@@ -350,50 +872,37 @@ class AssureVisionApp(QWidget):
             return
         self.filtered_data = self.apply_filters(self.all_data)
         self.load_images()
+        self._prepare_charts()
+
+    def _prepare_charts(self):
+        """Compute chart series off the UI thread; charts and dashboard redraw when they land."""
+        self._chart_series = None
+        self._chart_prep_generation += 1
+        job = ChartPrepJob(self._chart_prep_generation, self.filtered_data)
+        job.signals.finished.connect(self._on_chart_series)
+        self._chart_prep_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_chart_series(self, generation, series):
+        # a newer filter change is already being prepared
+        if generation != self._chart_prep_generation:
+            return
+        self._chart_series = series
         self.load_charts()
         self.update_dashboard()
 
     # ---------------- Data parsing ----------------
-    def parse_folder_data(self, folder):
-        data_by_prefix = defaultdict(list)
-        # reset aggregated causes
-        self._aggregated_failure_causes = defaultdict(list)
-
-        for root, _, files in os.walk(folder):
-            for file in files:
-                if not file.lower().endswith(".txt"):
-                    continue
-                file_path = os.path.join(root, file)
-                ts = datetime.fromtimestamp(os.path.getmtime(file_path))
-                parts = file[:-4].split("_")
-                prefix = "_".join(parts[:-1]) if len(parts) > 1 else parts[0]
-
-                content = load_txt(file_path)
-                is_pass = txt_is_pass(content)
-
-                # collect failure causes: every label that is not Job.Pass / Job.Fail and not ':OK'
-                labels = [p.strip() for p in content.split(",") if p.strip()]
-                for lbl in labels:
-                    norm = lbl.replace(" ", "")
-                    up = norm.upper()
-                    if up.startswith("JOB.PASS") or up.startswith("JOB.FAIL"):
-                        continue
-                    # also ignore explicit OK markers
-                    if up.endswith(":OK") or up.endswith("=OK"):
-                        continue
-                    # this label considered a failure cause — store path
-                    if not is_pass:  # only aggregate for failed items
-                        self._aggregated_failure_causes[lbl].append(file_path)
-
-                data_by_prefix[prefix].append(
-                    {
-                        "ts": ts,
-                        "is_pass": is_pass,
-                        "path": file_path,
-                        "content": content,
-                    }
-                )
-        return data_by_prefix
+    def _on_parsed(self, folder, result):
+        # results of a folder that is no longer selected are dropped
+        if folder != self.folder_path:
+            return
+        self.all_data = result["data"]
+        self._events_by_path = result["events_by_path"]
+        self._event_paths = result["event_paths"]
+        self._cause_eids = result["cause_eids"]
+        self._cause_labels = result["cause_labels"]
+        self._folder_cache = {}
+        self.update_everything()
 
     # ---------------- Filtering ----------------
     def apply_filters(self, data):
@@ -402,87 +911,67 @@ class AssureVisionApp(QWidget):
         end_ok = self.end_date_edit.date().isValid()
         start_date = self.start_date_edit.date().toPyDate() if start_ok else None
         end_date = self.end_date_edit.date().toPyDate() if end_ok else None
-
-        for prefix, events in data.items():
-            out = []
-            for ev in events:
-                ts = ev["ts"]
-                if start_ok and ts.date() < start_date:
-                    continue
-                if end_ok and ts.date() > end_date:
-                    continue
-                if self.outcome_filter == "Fail" and ev["is_pass"]:
-                    continue
-                if self.outcome_filter == "Pass" and not ev["is_pass"]:
-                    continue
-                out.append(ev)
-            filtered[prefix] = out
+        # local-midnight bounds as epoch seconds; end is exclusive (next midnight)
+        if start_ok:
+            start_epoch = int(datetime.combine(start_date, time.min).timestamp())
+        if end_ok:
+            end_epoch = int(datetime.combine(end_date + timedelta(days=1), time.min).timestamp())
+
+        for prefix, cols in data.items():
+            ts = cols["ts"]
+            mask = np.ones(len(ts), dtype=bool)
+            if start_ok:
+                mask &= ts >= start_epoch
+            if end_ok:
+                mask &= ts < end_epoch
+            if self.outcome_filter == "Fail":
+                mask &= ~cols["is_pass"]
+            elif self.outcome_filter == "Pass":
+                mask &= cols["is_pass"]
+            filtered[prefix] = {k: v[mask] for k, v in cols.items()}
+
+        keep = np.zeros(len(self._event_paths), dtype=bool)
+        for cols in filtered.values():
+            keep[cols["eid"]] = True
+        self._keep_mask = keep
         return filtered
 
     # ---------------- Dashboard ----------------
     def update_dashboard(self):
-        # clear gauges
-        for i in reversed(range(self.gauge_layout.count())):
-            w = self.gauge_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-        # clear step chart container
-        for i in reversed(range(self.dashboard_step_chart.count())):
-            w = self.dashboard_step_chart.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-
         # totals computed from filtered_data
-        total_count = sum(len(v) for v in self.filtered_data.values())
-        total_pass = sum(
-            sum(1 for ev in v if ev["is_pass"]) for v in self.filtered_data.values()
-        )
+        total_count = sum(len(v["ts"]) for v in self.filtered_data.values())
+        total_pass = sum(int(v["is_pass"].sum()) for v in self.filtered_data.values())
         total_fail = total_count - total_pass
 
-        gauges = [
-            ("Total", total_count, total_count if total_count > 0 else 1, "blue"),
-            ("Pass", total_pass, total_count if total_count > 0 else 1, "green"),
-            ("Fail", total_fail, total_count if total_count > 0 else 1, "red"),
-        ]
-        for title, val, max_val, color in gauges:
-            fig = create_gauge(val, max_val, title, color=color)
-            canvas = FigureCanvas(fig)
-            card = QFrame()
-            card.setStyleSheet(_gauge_css)
-            card_layout = QVBoxLayout(card)
-            card_layout.addWidget(canvas)
-            self.gauge_layout.addWidget(card)
+        max_val = total_count if total_count > 0 else 1
+        self._gauges["Total"].set_value(total_count, max_val)
+        self._gauges["Pass"].set_value(total_pass, max_val)
+        self._gauges["Fail"].set_value(total_fail, max_val)
+
+        if self._chart_series is None:
+            return  # step chart is drawn once the series are prepared
 
         # cumulative step chart (count events, not just pass)
-        fig, ax = plt.subplots(figsize=(12, 3.5))
-        for prefix, events in self.filtered_data.items():
-            sorted_ev = sorted(events, key=lambda e: e["ts"])
-            x_vals, y_vals = [], []
-            total = 0
-            for ev in sorted_ev:
-                total += 1  # 1 per event after filters
-                x_vals.append(ev["ts"])
-                y_vals.append(total)
-            if x_vals:
-                ax.step(x_vals, y_vals, where="post", label=prefix)
+        fig, ax = self._chart_axes("Dashboard", self.dashboard_step_chart, figsize=(12, 3.5))
+        artists = []
+        for prefix, (x_vals, counts, _) in self._chart_series.items():
+            artists += ax.step(x_vals, counts, where="post", label=prefix)
         ax.set_title("Cumulative Step Chart")
         ax.set_xlabel("Time")
         ax.set_ylabel("Cumulative Count")
         ax.grid(True)
         ax.legend()
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+        ax.xaxis_date(_LOCAL_TZ)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M", tz=_LOCAL_TZ))
         fig.autofmt_xdate()
-        mplcursors.cursor(ax, hover=True)
-        canvas = FigureCanvas(fig)
-        card = QFrame()
-        card.setStyleSheet(_chart_css)
-        card_layout = QVBoxLayout(card)
-        card_layout.addWidget(canvas)
-        self.dashboard_step_chart.addWidget(card)
+        if self.dashboard_tooltips_check.isChecked():
+            self._attach_cursor("Dashboard", artists)
+        self._chart_canvases["Dashboard"][2].draw_idle()
 
     # ---------------- Images (respect outcome filter) ----------------
     def load_images(self):
-        self.images_tab.clear()
+        _clear_tabs(self.images_tab)
+        self._lazy_tabs = {}
         if not self.folder_path:
             return
         subfolders = [
@@ -492,10 +981,36 @@ class AssureVisionApp(QWidget):
         ]
         subfolders.sort()
 
+        self.images_tab.blockSignals(True)
         for sub in subfolders:
             sub_path = os.path.join(self.folder_path, sub)
-            viewer = FolderViewer(sub_path, outcome_filter=self.outcome_filter)
-            self.images_tab.addTab(viewer, sub)
+            stub = QWidget()
+            self._lazy_tabs[stub] = (sub_path, self.outcome_filter)
+            self.images_tab.addTab(stub, sub)
+        self.images_tab.blockSignals(False)
+        self._materialize_image_tab(self.images_tab.currentIndex())
+
+    def _materialize_image_tab(self, index):
+        # only build viewers while the Images tab is actually on screen
+        if self.tabs.currentWidget() is not self.images_tab:
+            return
+        stub = self.images_tab.widget(index)
+        if stub not in self._lazy_tabs:
+            return
+        sub_path, outcome_filter = self._lazy_tabs.pop(stub)
+        viewer = FolderViewer(
+            sub_path,
+            outcome_filter=outcome_filter,
+            events=self._events_by_path,
+            cache=self._folder_cache,
+        )
+        label = self.images_tab.tabText(index)
+        self.images_tab.blockSignals(True)
+        self.images_tab.insertTab(index, viewer, label)
+        self.images_tab.removeTab(index + 1)
+        self.images_tab.setCurrentIndex(index)
+        self.images_tab.blockSignals(False)
+        stub.deleteLater()
 
     # ---------------- NEW: show filtered images by cause ----------------
     def filter_image_viewer(self, files, cause):
@@ -503,7 +1018,8 @@ class AssureVisionApp(QWidget):
         files: list of full paths to the .txt files which matched the cause
         cause: label string clicked
         """
-        self.images_tab.clear()
+        _clear_tabs(self.images_tab)
+        self._lazy_tabs = {}
         if not files:
             empty_tab = QWidget()
             empty_tab.setLayout(QVBoxLayout())
@@ -517,7 +1033,8 @@ class AssureVisionApp(QWidget):
             subfolders[os.path.dirname(f)].append(f)
 
         for folder_path, flist in subfolders.items():
-            viewer = FolderViewer(os.path.basename(folder_path), flist)
+            events = {f: self._events_by_path[f] for f in flist if f in self._events_by_path}
+            viewer = FolderViewer(folder_path, events=events)
             tab_label = f"{os.path.basename(folder_path)} ({cause})"
             self.images_tab.addTab(viewer, tab_label)
 
@@ -531,61 +1048,87 @@ class AssureVisionApp(QWidget):
 
     # ---------------- Charts ----------------
     def load_charts(self):
-        self.charts_tab.clear()
-        if not self.folder_path:
+        if not self.folder_path or self._chart_series is None:
             return
 
-        cumulative_tab = QWidget()
-        heartbeat_tab = QWidget()
-        summary_tab = QWidget()
-        failures_tab = QWidget()  # failure causes tab
-
-        self.charts_tab.addTab(cumulative_tab, "Cumulative")
-        self.charts_tab.addTab(heartbeat_tab, "Heartbeat")
-        self.charts_tab.addTab(summary_tab, "Summary")
-        self.charts_tab.addTab(failures_tab, "Failure Causes")
+        # data or chart type changed: every chart is stale, redraw the visible one now
+        # and the others when their tab is first shown
+        self._built_charts = set()
+        self._materialize_chart_tab(self.chart_tab_bar.currentIndex())
+
+    def _materialize_chart_tab(self, index):
+        """Render the chart in sub-tab `index` if it is on screen and not yet drawn for the current data."""
+        if (
+            not self.folder_path
+            or self._chart_series is None
+            or self.tabs.currentWidget() is not self.charts_tab
+        ):
+            return
+        name = self.chart_tab_bar.tabText(index)
+        if name not in self._chart_renderers or name in self._built_charts:
+            return
+        self._built_charts.add(name)
+        self._chart_renderers[name](self._chart_tabs[name])
 
-        for tab in [cumulative_tab, heartbeat_tab, summary_tab, failures_tab]:
-            tab.setLayout(QVBoxLayout())
+    def _attach_cursor(self, name, artists, hover=False):
+        """
+        Attach an mplcursors cursor to just the plotted artists (click-only by default).
+        Nothing is attached when the chart has no data.
+        """
+        if not artists:
+            return None
+        cursor = mplcursors.cursor(artists, hover=hover)
+        self._chart_cursors[name] = cursor
+        return cursor
 
-        self.render_cumulative_chart(cumulative_tab)
-        self.render_heartbeat_chart(heartbeat_tab)
-        self.render_summary_chart(summary_tab)
-        self.render_failure_causes_chart(failures_tab)
+    def _chart_axes(self, name, layout, figsize=(10, 5)):
+        """
+        Return the (fig, ax) for a chart, cleared and ready to re-plot.
+        The Figure/FigureCanvas pair is created and added to layout on first use only.
+        """
+        entry = self._chart_canvases.get(name)
+        if entry is None:
+            # plain Figure, not pyplot: the canvas owns it and no global figure manager is involved
+            fig = Figure(figsize=figsize)
+            canvas = FigureCanvas(fig)
+            canvas.setMinimumSize(_CHART_MIN_SIZE)
+            ax = fig.add_subplot()
+            layout.addWidget(_make_card(canvas))
+            self._chart_canvases[name] = (fig, ax, canvas)
+            return fig, ax
+        fig, ax, _ = entry
+        # drop the hover cursor bound to the previous plot's artists
+        cursor = self._chart_cursors.pop(name, None)
+        if cursor is not None:
+            cursor.remove()
+        ax.clear()
+        return fig, ax
 
     def render_failure_causes_chart(self, tab):
-        # Aggregate failure causes from filtered_data (only failed events)
-        cause_counts = defaultdict(list)
-        for prefix, events in self.filtered_data.items():
-            for ev in events:
-                if not ev["is_pass"]:
-                    labels = [p.strip() for p in ev["content"].split(",") if p.strip()]
-                    for lbl in labels:
-                        up = lbl.replace(" ", "").upper()
-                        if up.startswith("JOB.PASS") or up.startswith("JOB.FAIL"):
-                            continue
-                        # ignore OK markers
-                        if up.endswith(":OK") or up.endswith("=OK"):
-                            continue
-                        cause_counts[lbl].append(ev["path"])
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        labels = list(cause_counts.keys())
-        values = [len(v) for v in cause_counts.values()]
+        # Count failure causes of the filtered events via the (event id, cause) index;
+        # causes only exist for failed events, so no pass/fail check is needed
+        selected = self._keep_mask[self._cause_eids]
+        # causes are interned at parse time, so this is plain hashing/counting in C
+        cause_counts = Counter(self._cause_labels[selected].tolist())
+
+        fig, ax = self._chart_axes("Failure Causes", tab.layout())
+        # most frequent cause first
+        labels, values = zip(*cause_counts.most_common()) if cause_counts else ((), ())
 
         if not labels:
             ax.text(0.5, 0.5, "No failure causes found", ha="center", va="center")
         else:
             bars = ax.bar(labels, values, color="orange")
             ax.set_xticklabels(labels, rotation=45, ha="right")
-            # connect click/hover to open filtered image viewer
-            cursor = mplcursors.cursor(bars, hover=True)
+            # connect click to open filtered image viewer
+            cursor = self._attach_cursor("Failure Causes", [bars])
 
             # On select/click we will call filter_image_viewer
             def on_add(sel):
                 idx = sel.index
                 lbl = labels[idx]
-                paths = cause_counts[lbl]
+                eids = self._cause_eids[selected & (self._cause_labels == lbl)]
+                paths = self._event_paths[eids].tolist()
                 # open images for this cause
                 self.filter_image_viewer(paths, lbl)
 
@@ -595,67 +1138,47 @@ class AssureVisionApp(QWidget):
         ax.set_ylabel("Count")
         ax.grid(True)
         fig.tight_layout()
-        canvas = FigureCanvas(fig)
-        card = QFrame()
-        card.setStyleSheet(_chart_css)
-        card_layout = QVBoxLayout(card)
-        card_layout.addWidget(canvas)
-        tab.layout().addWidget(card)
+        self._chart_canvases["Failure Causes"][2].draw_idle()
 
     # ---------------- Chart helpers (reuse from earlier) ----------------
     def render_cumulative_chart(self, tab):
-        self._render_time_chart(tab, "Cumulative Count Over Time", cumulative=True)
+        self._render_time_chart(
+            tab, "Cumulative", "Cumulative Count Over Time", cumulative=True
+        )
 
     def render_summary_chart(self, tab):
         # count events per prefix (after filters)
-        summary_counts = {k: len(v) for k, v in self.filtered_data.items()}
-        fig, ax = plt.subplots(figsize=(10, 5))
+        summary_counts = {k: len(v["ts"]) for k, v in self.filtered_data.items()}
+        fig, ax = self._chart_axes("Summary", tab.layout())
         prefixes = list(summary_counts.keys())
         values = list(summary_counts.values())
 
+        artists = []
         if self.chart_type == "Bar":
-            ax.bar(prefixes, values)
+            artists.append(ax.bar(prefixes, values))
         elif self.chart_type == "Line":
-            ax.plot(prefixes, values, marker="o")
+            artists += ax.plot(prefixes, values, marker="o")
         elif self.chart_type == "Step":
-            ax.step(prefixes, values, where="post")
+            artists += ax.step(prefixes, values, where="post")
         elif self.chart_type == "Scatter":
-            ax.scatter(prefixes, values)
+            artists.append(ax.scatter(prefixes, values))
 
         ax.set_title("Summary Chart by Prefix")
         ax.set_xlabel("Prefix")
         ax.set_ylabel("Event Count")
         ax.grid(True)
-        mplcursors.cursor(ax, hover=True)
-        canvas = FigureCanvas(fig)
-        card = QFrame()
-        card.setStyleSheet(_chart_css)
-        card_layout = QVBoxLayout(card)
-        card_layout.addWidget(canvas)
-        tab.layout().addWidget(card)
+        # few points here, so hover stays on
+        if prefixes:
+            self._attach_cursor("Summary", artists, hover=True)
+        self._chart_canvases["Summary"][2].draw_idle()
 
     def render_heartbeat_chart(self, tab):
-        # per-minute bins of pass/fail per prefix
-        time_bin = 60  # seconds
-        grouped = defaultdict(lambda: defaultdict(lambda: {"pass": 0, "fail": 0}))
-        for prefix, events in self.filtered_data.items():
-            for ev in events:
-                ts = ev["ts"]
-                binned_ts = datetime.fromtimestamp(
-                    ts.timestamp() // time_bin * time_bin
-                )
-                if ev["is_pass"]:
-                    grouped[prefix][binned_ts]["pass"] += 1
-                else:
-                    grouped[prefix][binned_ts]["fail"] += 1
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        for prefix, bins in grouped.items():
-            times = sorted(bins.keys())
-            if not times:
-                continue
-            pass_vals = [bins[t]["pass"] for t in times]
-            fail_vals = [bins[t]["fail"] for t in times]
+        # per-minute bins of pass/fail per prefix: { prefix: (times, pass_vals, fail_vals) }
+        grouped = {prefix: bins for prefix, (_, _, bins) in self._chart_series.items()}
+
+        fig, ax = self._chart_axes("Heartbeat", tab.layout())
+        artists = []
+        for prefix, (times, pass_vals, fail_vals) in grouped.items():
 
             # Respect chart type and outcome filter
             show_pass = self.outcome_filter in ("All", "Pass")
@@ -663,12 +1186,12 @@ class AssureVisionApp(QWidget):
 
             if self.chart_type == "Line":
                 if show_pass:
-                    ax.plot(times, pass_vals, label=f"{prefix}-Pass", color="green")
+                    artists += ax.plot(times, pass_vals, label=f"{prefix}-Pass", color="green")
                 if show_fail:
-                    ax.plot(times, fail_vals, label=f"{prefix}-Fail", color="red")
+                    artists += ax.plot(times, fail_vals, label=f"{prefix}-Fail", color="red")
             elif self.chart_type == "Step":
                 if show_pass:
-                    ax.step(
+                    artists += ax.step(
                         times,
                         pass_vals,
                         where="post",
@@ -676,7 +1199,7 @@ class AssureVisionApp(QWidget):
                         color="green",
                     )
                 if show_fail:
-                    ax.step(
+                    artists += ax.step(
                         times,
                         fail_vals,
                         where="post",
@@ -688,7 +1211,7 @@ class AssureVisionApp(QWidget):
                 # matplotlib date units are days; convert 1 minute to days
                 width = 1.0 / (24 * 60) * 0.8
                 if show_pass:
-                    ax.bar(
+                    bars = ax.bar(
                         times,
                         pass_vals,
                         width=width,
@@ -696,8 +1219,9 @@ class AssureVisionApp(QWidget):
                         color="green",
                         align="center",
                     )
+                    artists.append(bars)
                 if show_fail:
-                    ax.bar(
+                    bars = ax.bar(
                         times,
                         fail_vals,
                         width=width,
@@ -705,122 +1229,91 @@ class AssureVisionApp(QWidget):
                         color="red",
                         align="center",
                     )
+                    artists.append(bars)
             elif self.chart_type == "Scatter":
                 if show_pass:
-                    ax.scatter(times, pass_vals, label=f"{prefix}-Pass", color="green")
+                    artists.append(
+                        ax.scatter(times, pass_vals, label=f"{prefix}-Pass", color="green")
+                    )
                 if show_fail:
-                    ax.scatter(times, fail_vals, label=f"{prefix}-Fail", color="red")
+                    artists.append(
+                        ax.scatter(times, fail_vals, label=f"{prefix}-Fail", color="red")
+                    )
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Count")
         ax.set_title("Heartbeat Chart (Pass/Fail by Prefix)")
         ax.grid(True)
         ax.legend()
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+        ax.xaxis_date(_LOCAL_TZ)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M", tz=_LOCAL_TZ))
         fig.autofmt_xdate()
-        mplcursors.cursor(ax, hover=True)
-        canvas = FigureCanvas(fig)
-        card = QFrame()
-        card.setStyleSheet(_chart_css)
-        card_layout = QVBoxLayout(card)
-        card_layout.addWidget(canvas)
-        tab.layout().addWidget(card)
-
-    def _render_time_chart(self, tab, title, y_label="Value", cumulative=False):
-        # clear existing
-        for i in reversed(range(tab.layout().count())):
-            w = tab.layout().itemAt(i).widget()
-            if w:
-                w.setParent(None)
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        for prefix, events in self.filtered_data.items():
-            sorted_ev = sorted(events, key=lambda e: e["ts"])
-            if not sorted_ev:
-                continue
-            x_vals, y_vals = [], []
-            running = 0
-            for ev in sorted_ev:
-                x_vals.append(ev["ts"])
-                if cumulative:
-                    running += 1  # count each filtered event
-                    y_vals.append(running)
-                else:
-                    y_vals.append(1)  # event per timestamp
+        self._attach_cursor("Heartbeat", artists)
+        self._chart_canvases["Heartbeat"][2].draw_idle()
+
+    def _render_time_chart(self, tab, name, title, y_label="Value", cumulative=False):
+        fig, ax = self._chart_axes(name, tab.layout())
+        artists = []
+        for prefix, (x_vals, counts, _) in self._chart_series.items():
+            if cumulative:
+                y_vals = counts  # count each filtered event
+            else:
+                y_vals = np.ones(len(x_vals), dtype=int)  # event per timestamp
             # draw by chart type
             if self.chart_type == "Line":
-                ax.plot(x_vals, y_vals, label=prefix)
+                artists += ax.plot(x_vals, y_vals, label=prefix)
             elif self.chart_type == "Step":
-                ax.step(x_vals, y_vals, where="post", label=prefix)
+                artists += ax.step(x_vals, y_vals, where="post", label=prefix)
             elif self.chart_type == "Bar":
                 width = 1.0 / (24 * 60) * 0.8  # narrow bar ~0.8 minute
-                ax.bar(x_vals, y_vals, width=width, label=prefix, align="center")
+                artists.append(
+                    ax.bar(x_vals, y_vals, width=width, label=prefix, align="center")
+                )
             elif self.chart_type == "Scatter":
-                ax.scatter(x_vals, y_vals, label=prefix)
+                artists.append(ax.scatter(x_vals, y_vals, label=prefix))
 
         ax.set_title(title)
         ax.set_xlabel("Time")
         ax.set_ylabel(y_label)
         ax.grid(True)
         ax.legend()
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+        ax.xaxis_date(_LOCAL_TZ)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M", tz=_LOCAL_TZ))
         fig.autofmt_xdate()
-        mplcursors.cursor(ax, hover=True)
-        canvas = FigureCanvas(fig)
-        card = QFrame()
-        card.setStyleSheet(_chart_css)
-        card_layout = QVBoxLayout(card)
-        card_layout.addWidget(canvas)
-        tab.layout().addWidget(card)
+        self._attach_cursor(name, artists)
+        self._chart_canvases[name][2].draw_idle()
 
 
 # ---------------- Run Application ----------------
-if __name__ == "__main__":
+# Startup lives in main() so the entry point can be compiled as-is, e.g.
+#   nuitka --standalone --enable-plugin=pyqt5 --include-data-dir=styles=styles desktopApp.py
+# (the data dir is not needed when styles_rc.py has been generated)
+def main():
+    # application attributes only take effect when set before QApplication exists:
+    # share GL contexts, keep child widgets alien (no native window handles each),
+    # coalesce bursts of mouse-move/resize events, and let the app stylesheet reach
+    # children through the regular style propagation instead of per-child cascades
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    QApplication.setAttribute(Qt.AA_UseStyleSheetPropagationInWidgetStyles, True)
     app = QApplication(sys.argv)
-    # Apply dark theme
-    app.setStyle("Fusion")
-    dark_palette = QPalette()
-    dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.WindowText, Qt.white)
-    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-    dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-    dark_palette.setColor(QPalette.Text, Qt.white)
-    dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ButtonText, Qt.white)
-    dark_palette.setColor(QPalette.BrightText, Qt.red)
-    app.setPalette(dark_palette)
-
-    # Apply stylesheet for modern buttons/tabs
-    app.setStyleSheet(
-        """
-        QPushButton {
-            background-color: #1976D2;
-            color: white;
-            border-radius: 8px;
-            padding: 6px 12px;
-        }
-        QPushButton:hover {
-            background-color: #1565C0;
-        }
-        QTabWidget::pane {
-            border: 1px solid #444;
-            background: #2b2b2b;
-        }
-        QTabBar::tab {
-            background: #444;
-            padding: 8px;
-            border-radius: 6px;
-            margin: 2px;
-            color: white;
-        }
-        QTabBar::tab:selected {
-            background: #1976D2;
-            color: white;
-        }
-    """
-    )
-    window = AssureVisionApp()
+    QPixmapCache.setCacheLimit(65536)  # KB, room for a few pages of thumbnails
+    # Style, dark palette and stylesheet are all applied before any widget exists,
+    # so the window is polished once against the final look; the style is only
+    # replaced when the platform default (or -style) is not Fusion already
+    if app.style().objectName().lower() != "fusion":
+        app.setStyle("Fusion")
+    app.setPalette(_build_dark_palette())
+    app.setStyleSheet(_load_qss("app.qss"))
+
+    # paint the (empty) window first; matplotlib is imported once the event loop runs
+    window = AssureVisionApp(defer_imports=True)
     window.show()
+    app.processEvents()
+    QTimer.singleShot(0, window.finish_loading)
     sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()